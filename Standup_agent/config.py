@@ -3,7 +3,7 @@
 from google.adk.auth import AuthCredential, AuthCredentialTypes, OAuth2Auth
 from fastapi.openapi.models import OAuth2, OAuthFlows, OAuthFlowAuthorizationCode
 
-from .utils import load_oauth_credentials, GOOGLE_SCOPES, JIRA_SCOPES
+from .utils import load_oauth_credentials, load_jira_oauth_credentials, GOOGLE_SCOPES, JIRA_SCOPES
 
 # Load Google OAuth credentials
 GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET = load_oauth_credentials()
@@ -27,11 +27,10 @@ google_auth_credential = AuthCredential(
     ),
 )
 
-# Jira OAuth2 configuration (Atlassian)
-JIRA_CLIENT_ID = "Nt6B1qBlxxxxxx"
-JIRA_CLIENT_SECRET = "xxxx"
-JIRA_SITE_URL = "wow-sandbox2.atlassian.net"
+# Load Jira OAuth credentials (ATLASSIAN_* environment variables, see .env)
+JIRA_CLIENT_ID, JIRA_CLIENT_SECRET, JIRA_SITE_URL = load_jira_oauth_credentials()
 
+# Jira OAuth2 configuration (Atlassian)
 jira_auth_scheme = OAuth2(
     flows=OAuthFlows(
         authorizationCode=OAuthFlowAuthorizationCode(
@@ -1,16 +1,25 @@
 """Tool functions for Standup Agent."""
 
+import time
 from typing import Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from google.adk.tools import ToolContext
-import requests
+import orjson
 from .utils import (
-    get_sydney_date, extract_ticket_keys, parse_speakers,
+    get_sydney_date, extract_ticket_keys, parse_speakers, index_ticket_mentions,
     extract_date_from_transcript, generate_adf_comment,
-    get_authenticated_google_services, get_jira_cloud_id, SYDNEY_TZ
+    get_authenticated_google_services, get_jira_cloud_id, get_jira_session, post_read_only_jira,
+    run_in_thread, SYDNEY_TZ, STANDUP_TITLE, JIRA_API_BASE, JIRA_POOL_SIZE, JIRA_ISSUE_CACHE_PREFIX, JIRA_ISSUE_TTL_SEC
 )
 
+# Calendar partial responses - only the event fields the tools read
+CALENDAR_EVENT_FIELDS = 'id,summary,start,hangoutLink'
+CALENDAR_EVENT_LIST_FIELDS = f'items({CALENDAR_EVENT_FIELDS}),nextPageToken'
 
+
+@run_in_thread
 def fetch_calendar_events(days_back: int = 7, only_with_notes: bool = True, tool_context: Optional[ToolContext] = None) -> dict:
     """Fetch Google Calendar events from the last N days, optionally filtering for those with notes.
     
@@ -24,7 +33,7 @@ def fetch_calendar_events(days_back: int = 7, only_with_notes: bool = True, tool
     """
     try:
         from .config import google_auth_scheme, google_auth_credential, GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
-        from .utils import get_meet_code, check_for_transcript_and_recording
+        from .utils import get_meet_code, batch_search_meeting_notes, parallel_search_meeting_notes
         
         services = get_authenticated_google_services(
             tool_context, google_auth_scheme, google_auth_credential,
@@ -39,16 +48,25 @@ def fetch_calendar_events(days_back: int = 7, only_with_notes: bool = True, tool
         now = datetime.now(SYDNEY_TZ)
         start_date = (now - timedelta(days=days_back)).replace(hour=0, minute=0, second=0)
         
-        events_result = cal_service.events().list(
-            calendarId='primary',
-            timeMin=start_date.isoformat(),
-            timeMax=now.isoformat(),
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+        events = []
+        page_token = None
+        while True:
+            events_result = cal_service.events().list(
+                calendarId='primary',
+                timeMin=start_date.isoformat(),
+                timeMax=now.isoformat(),
+                singleEvents=True,
+                orderBy='startTime',
+                fields=CALENDAR_EVENT_LIST_FIELDS,
+                pageToken=page_token
+            ).execute()
+            events.extend(events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
         
-        events = events_result.get('items', [])
         result_events = []
+        pending = []
         
         for e in events:
             summary = e.get('summary', 'No Title')
@@ -62,23 +80,29 @@ def fetch_calendar_events(days_back: int = 7, only_with_notes: bool = True, tool
                 "has_meet": bool(meet_link)
             }
             
-            # Check for notes if filtering
+            # Queue a notes lookup if filtering
             if only_with_notes and meet_link:
-                meet_code = get_meet_code(meet_link)
-                event_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                media = check_for_transcript_and_recording(cal_service, drive_service, meet_code, summary, event_time)
-                
-                if media:
-                    if media.get('notes'):
-                        event_info['notes_id'] = media['notes']['id']
-                        event_info['notes_link'] = media['notes']['link']
-                    if media.get('transcript'):
-                        event_info['transcript_id'] = media['transcript']['id']
-                        event_info['transcript_link'] = media['transcript']['link']
-                    result_events.append(event_info)
+                if get_meet_code(meet_link):
+                    event_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
+                    pending.append((event_info, event_time))
             elif not only_with_notes:
                 result_events.append(event_info)
         
+        # Look up notes for all queued events in batched Drive requests
+        if pending:
+            lookups = [(info['id'], info['summary'], event_time) for info, event_time in pending]
+            try:
+                notes_by_event = batch_search_meeting_notes(drive_service, lookups)
+            except Exception:
+                # Batch endpoint unavailable - run the searches in parallel instead
+                notes_by_event = parallel_search_meeting_notes(drive_service, lookups)
+            for event_info, _ in pending:
+                notes = notes_by_event.get(event_info['id'])
+                if notes:
+                    event_info['notes_id'] = notes['id']
+                    event_info['notes_link'] = notes['link']
+                    result_events.append(event_info)
+        
         return {
             "status": "success",
             "events": result_events,
@@ -109,23 +133,28 @@ def parse_transcript(transcript_text: str, default_project: str = "WJR") -> dict
         # Parse speakers
         speakers = parse_speakers(transcript_text)
         
+        # Index speaker lines by the keys and numbers they mention, in one pass
+        mentions = index_ticket_mentions(speakers)
+        speaker_names = list(speakers)
+        speaker_lines = list(speakers.values())
+        
         # Group content by ticket
         ticket_contexts = {}
         for ticket in tickets:
             ticket_key = ticket['key']
+            ticket_speakers = {}
             ticket_contexts[ticket_key] = {
                 'confidence': ticket['confidence'],
                 'type': ticket['type'],
-                'speakers': {},
+                'speakers': ticket_speakers,
                 'mentions': []
             }
             
-            # Find mentions in speaker content
-            for speaker, lines in speakers.items():
-                relevant_lines = [line for line in lines if ticket_key in line or 
-                                any(str(ticket_key.split('-')[1]) in line for line in lines)]
-                if relevant_lines:
-                    ticket_contexts[ticket_key]['speakers'][speaker] = relevant_lines
+            # Lines mentioning the full key or the bare ticket number, in transcript order
+            positions = set(mentions.get(ticket_key, ()))
+            positions.update(mentions.get(ticket_key.split('-', 1)[1], ()))
+            for speaker_idx, line_idx in sorted(positions):
+                ticket_speakers.setdefault(speaker_names[speaker_idx], []).append(speaker_lines[speaker_idx][line_idx])
         
         return {
             "status": "success",
@@ -139,17 +168,46 @@ def parse_transcript(transcript_text: str, default_project: str = "WJR") -> dict
         return {"status": "error", "error_message": str(e)}
 
 
+def _cache_jira_token(tool_context, access_token, refresh_token, expires_at):
+    """Store Jira token details in state"""
+    from .utils import JIRA_TOKEN_CACHE_KEY
+    
+    tool_context.state[JIRA_TOKEN_CACHE_KEY] = access_token
+    tool_context.state[JIRA_TOKEN_CACHE_KEY + "_refresh"] = refresh_token
+    tool_context.state[JIRA_TOKEN_CACHE_KEY + "_expires_at"] = expires_at
+
+
 def get_jira_auth(tool_context):
     """Get Jira authentication token with caching"""
-    from .config import jira_auth_credential, jira_auth_scheme
+    from .config import jira_auth_credential, jira_auth_scheme, JIRA_CLIENT_ID, JIRA_CLIENT_SECRET
     from google.adk.auth import AuthConfig
-    from .utils import JIRA_TOKEN_CACHE_KEY
+    from .utils import JIRA_TOKEN_CACHE_KEY, single_flight_refresh, refresh_jira_token, hash_token
     
     # Check cache first
     cached_token = tool_context.state.get(JIRA_TOKEN_CACHE_KEY)
-    if cached_token:
+    expires_at = tool_context.state.get(JIRA_TOKEN_CACHE_KEY + "_expires_at")
+    if cached_token and (not expires_at or time.time() < expires_at - 60):
         return cached_token
     
+    # Refresh an expired token, sharing one refresh between concurrent callers
+    refresh_token = tool_context.state.get(JIRA_TOKEN_CACHE_KEY + "_refresh")
+    if cached_token and refresh_token:
+        try:
+            token_info = single_flight_refresh(
+                "jira_" + hash_token(refresh_token),
+                lambda: refresh_jira_token(
+                    refresh_token, jira_auth_scheme.flows.authorizationCode.tokenUrl,
+                    JIRA_CLIENT_ID, JIRA_CLIENT_SECRET
+                )
+            )
+            _cache_jira_token(
+                tool_context, token_info["access_token"],
+                token_info["refresh_token"], token_info["expires_at"]
+            )
+            return token_info["access_token"]
+        except Exception:
+            pass
+    
     # Get OAuth token
     auth_config = AuthConfig(auth_scheme=jira_auth_scheme, raw_auth_credential=jira_auth_credential)
     exchanged_credential = tool_context.get_auth_response(auth_config)
@@ -161,11 +219,118 @@ def get_jira_auth(tool_context):
     access_token = exchanged_credential.oauth2.access_token
     
     # Cache it
-    tool_context.state[JIRA_TOKEN_CACHE_KEY] = access_token
+    _cache_jira_token(
+        tool_context, access_token,
+        exchanged_credential.oauth2.refresh_token, exchanged_credential.oauth2.expires_at
+    )
     
     return access_token
 
 
+# Jira bulk lookup
+JIRA_BULK_FETCH_LIMIT = 100
+JIRA_ISSUE_FIELDS = ["status", "assignee", "summary"]
+
+
+def _issue_result(key, fields):
+    """Shape Jira issue fields into a validation result"""
+    return {
+        "key": key,
+        "valid": True,
+        "status": fields['status']['name'],
+        "assignee": (fields.get('assignee') or {}).get('displayName', 'Unassigned'),
+        "summary": fields['summary']
+    }
+
+
+def _not_found_result(key):
+    """Validation result for a ticket Jira does not know about"""
+    return {
+        "key": key,
+        "valid": False,
+        "not_found": True,
+        "error": "Not found"
+    }
+
+
+def _bulk_fetch_jira_issues(session, cloud_id, headers, keys):
+    """Fetch up to 100 issues in one request
+    
+    Returns:
+        tuple: (fields keyed by upper-cased issue key, upper-cased keys Jira reported missing),
+            or None if the request failed
+    """
+    url = f"{JIRA_API_BASE}/ex/jira/{cloud_id}/rest/api/3/issue/bulkfetch"
+    payload = {"issueIdsOrKeys": keys, "fields": JIRA_ISSUE_FIELDS}
+    # Bulk fetch only reads, so it is safe to retry on 429/5xx
+    response = post_read_only_jira(
+        session, url, data=orjson.dumps(payload),
+        headers={**headers, "Content-Type": "application/json"}, timeout=10
+    )
+    if response.status_code != 200:
+        return None
+    
+    data = orjson.loads(response.content)
+    issues = {issue['key'].upper(): issue['fields'] for issue in data.get('issues', [])}
+    missing = {str(error.get('id', '')).upper() for error in data.get('issueErrors', [])}
+    return issues, missing
+
+
+def _fetch_jira_issue(session, cloud_id, headers, key):
+    """Fetch a single Jira issue and shape it into a validation result"""
+    try:
+        url = f"{JIRA_API_BASE}/ex/jira/{cloud_id}/rest/api/3/issue/{key}"
+        params = {"fields": ",".join(JIRA_ISSUE_FIELDS)}
+        response = session.get(url, headers=headers, params=params, timeout=10)
+        
+        if response.status_code == 200:
+            return _issue_result(key, orjson.loads(response.content)['fields'])
+        if response.status_code == 404:
+            return _not_found_result(key)
+        return {
+            "key": key,
+            "valid": False,
+            "error": f"HTTP {response.status_code}"
+        }
+    except Exception as e:
+        return {
+            "key": key,
+            "valid": False,
+            "error": str(e)
+        }
+
+
+def _lookup_jira_issues(session, cloud_id, headers, keys):
+    """Look up Jira issues in bulk and return validation results keyed by ticket key"""
+    results = {}
+    unresolved = []
+    for i in range(0, len(keys), JIRA_BULK_FETCH_LIMIT):
+        chunk = keys[i:i + JIRA_BULK_FETCH_LIMIT]
+        fetched = _bulk_fetch_jira_issues(session, cloud_id, headers, chunk)
+        if fetched is None:
+            unresolved.extend(chunk)
+            continue
+        
+        issues, missing = fetched
+        for key in chunk:
+            if key.upper() in issues:
+                results[key] = _issue_result(key, issues[key.upper()])
+            elif key.upper() in missing:
+                results[key] = _not_found_result(key)
+            else:
+                # Returned under a different key (issue moved projects) - resolve it directly
+                unresolved.append(key)
+    
+    # Only keys the bulk fetch could not account for get a request of their own
+    if unresolved:
+        fetch = partial(_fetch_jira_issue, session, cloud_id, headers)
+        with ThreadPoolExecutor(max_workers=min(JIRA_POOL_SIZE, len(unresolved))) as executor:
+            results.update(zip(unresolved, executor.map(fetch, unresolved)))
+    
+    return results
+
+
+@run_in_thread
 def validate_jira_tickets(ticket_keys: list, tool_context: Optional[ToolContext] = None) -> dict:
     """Validate Jira ticket keys via Jira API.
     
@@ -177,52 +342,43 @@ def validate_jira_tickets(ticket_keys: list, tool_context: Optional[ToolContext]
         dict: Validation results for each ticket
     """
     try:
-        from .config import JIRA_SITE_URL
-        
-        jira_site = JIRA_SITE_URL
-        
-        # Get cached or new token
-        access_token = get_jira_auth(tool_context)
-        if not access_token:
-            return {"status": "pending", "message": "Awaiting Jira authentication"}
-        
-        # Get cloud ID (cached)
-        cloud_id = get_jira_cloud_id(access_token, tool_context)
-        if not cloud_id:
-            return {"status": "error", "error_message": "Failed to get Jira cloud ID"}
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/json"
-        }
-        
-        results = []
+        # Serve recently validated tickets from state, only hit Jira for the rest
+        now = time.time()
+        cached = {}
+        stale = []
         for key in ticket_keys:
-            try:
-                url = f"https://api.atlassian.com/ex/jira/{cloud_id}/rest/api/3/issue/{key}"
-                response = requests.get(url, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    results.append({
-                        "key": key,
-                        "valid": True,
-                        "status": data['fields']['status']['name'],
-                        "assignee": data['fields'].get('assignee', {}).get('displayName', 'Unassigned'),
-                        "summary": data['fields']['summary']
-                    })
-                else:
-                    results.append({
-                        "key": key,
-                        "valid": False,
-                        "error": f"HTTP {response.status_code}"
-                    })
-            except Exception as e:
-                results.append({
-                    "key": key,
-                    "valid": False,
-                    "error": str(e)
-                })
+            entry = tool_context.state.get(JIRA_ISSUE_CACHE_PREFIX + key)
+            if entry and now - entry['ts'] < JIRA_ISSUE_TTL_SEC:
+                cached[key] = entry['data']
+            else:
+                stale.append(key)
+        
+        fetched = {}
+        if stale:
+            # Get cached or new token
+            access_token = get_jira_auth(tool_context)
+            if not access_token:
+                return {"status": "pending", "message": "Awaiting Jira authentication"}
+            
+            # Get cloud ID (cached)
+            cloud_id = get_jira_cloud_id(access_token, tool_context)
+            if not cloud_id:
+                return {"status": "error", "error_message": "Failed to get Jira cloud ID"}
+            
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/json"
+            }
+            
+            session = get_jira_session()
+            fetched = _lookup_jira_issues(session, cloud_id, headers, stale)
+            for key, result in fetched.items():
+                if result['valid']:
+                    tool_context.state[JIRA_ISSUE_CACHE_PREFIX + key] = {"data": result, "ts": now}
+                elif result.get('not_found'):
+                    tool_context.state[JIRA_ISSUE_CACHE_PREFIX + key] = None
+        
+        results = [cached[key] if key in cached else fetched[key] for key in ticket_keys]
         
         return {"status": "success", "results": results}
     except Exception as e:
@@ -252,7 +408,7 @@ def generate_jira_comment(ticket_key: str, ticket_context: dict, date_str: str,
         )
         
         # Generate plain text preview
-        preview_lines = [f"Standup Update — {date_str}", ""]
+        preview_lines = [STANDUP_TITLE.format(date_str=date_str), ""]
         for speaker, points in speakers_data.items():
             preview_lines.append(f"{speaker}")
             for point in points:
@@ -278,6 +434,7 @@ def generate_jira_comment(ticket_key: str, ticket_context: dict, date_str: str,
         return {"status": "error", "error_message": str(e)}
 
 
+@run_in_thread
 def post_jira_comment(ticket_key: str, adf_comment: dict, tool_context: Optional[ToolContext] = None) -> dict:
     """Post comment to Jira ticket.
     
@@ -310,10 +467,10 @@ def post_jira_comment(ticket_key: str, adf_comment: dict, tool_context: Optional
             "Content-Type": "application/json"
         }
         
-        url = f"https://api.atlassian.com/ex/jira/{cloud_id}/rest/api/3/issue/{ticket_key}/comment"
+        url = f"{JIRA_API_BASE}/ex/jira/{cloud_id}/rest/api/3/issue/{ticket_key}/comment"
         payload = {"body": adf_comment}
         
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = get_jira_session().post(url, data=orjson.dumps(payload), headers=headers, timeout=10)
         
         if response.status_code in [200, 201]:
             return {
@@ -331,6 +488,7 @@ def post_jira_comment(ticket_key: str, adf_comment: dict, tool_context: Optional
         return {"status": "error", "error_message": str(e)}
 
 
+@run_in_thread
 def get_meeting_notes(event_id: str, tool_context: Optional[ToolContext] = None) -> dict:
     """Fetch meeting notes/transcript content for a specific event.
     
@@ -356,7 +514,9 @@ def get_meeting_notes(event_id: str, tool_context: Optional[ToolContext] = None)
         cal_service, drive_service = services
         
         # Get event details
-        event = cal_service.events().get(calendarId='primary', eventId=event_id).execute()
+        event = cal_service.events().get(
+            calendarId='primary', eventId=event_id, fields=CALENDAR_EVENT_FIELDS
+        ).execute()
         summary = event.get('summary', 'No Title')
         start = event['start'].get('dateTime', event['start'].get('date'))
         meet_link = event.get('hangoutLink')
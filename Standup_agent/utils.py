@@ -1,17 +1,23 @@
 """Utility functions for Standup Agent."""
 
 import os
+import asyncio
 import json
 import re
-from datetime import datetime, timezone
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
 from zoneinfo import ZoneInfo
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+import orjson
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-CREDENTIALS_PATH = os.path.join(SCRIPT_DIR, 'credentials.json')
+CREDENTIALS_PATH = os.environ.get('STANDUP_CREDENTIALS_PATH') or os.path.join(SCRIPT_DIR, 'credentials.json')
 TOKEN_CACHE_KEY = "standup_agent_tokens"
+DEFAULT_JIRA_SITE_URL = "wow-sandbox2.atlassian.net"
+_JIRA_OAUTH_CONFIG = None
 
 # Scopes
 GOOGLE_SCOPES = {
@@ -28,12 +34,79 @@ JIRA_SCOPES = {
 SYDNEY_TZ = ZoneInfo("Australia/Sydney")
 JIRA_TOKEN_CACHE_KEY = "standup_agent_jira_token"
 
+# Validated Jira issues are cached in tool_context.state for this long
+JIRA_ISSUE_CACHE_PREFIX = "jira_issue_"
+JIRA_ISSUE_TTL_SEC = 300
+
+# Drive meeting notes lookup
+DRIVE_BATCH_LIMIT = 100
+DRIVE_MAX_WORKERS = 8
+DRIVE_NUM_RETRIES = 3
+MEETING_NOTES_FIELDS = 'files(id,name,webViewLink)'
+MEETING_NOTES_NAME_MAX = 60
+
+# Jira HTTP connection pooling
+JIRA_API_BASE = "https://api.atlassian.com"
+JIRA_POOL_SIZE = 16
+_JIRA_SESSION = None
+_JIRA_SESSION_LOCK = threading.Lock()
+
+# Transient Jira failures worth retrying
+JIRA_RETRY_STATUSES = (429, 500, 502, 503, 504)
+JIRA_RETRY_TOTAL = 3
+JIRA_RETRY_BACKOFF_SEC = 0.2
+
+# Jira cloud IDs cached across sessions, keyed by access-token hash
+JIRA_CLOUD_ID_TTL_SEC = 3600
+_CLOUD_ID_CACHE = {}
+_CLOUD_ID_LOCK = threading.Lock()
+
+# In-flight OAuth refreshes, keyed by refresh-token hash
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_FUTURES = {}
+
+# Date formats parsed with strptime before falling back to dateutil
+DATE_FORMATS = ("%d %b %Y", "%d %B %Y", "%Y-%m-%d")
+
+# Comment title, shared by the ADF body and the plain-text preview
+STANDUP_TITLE = "Standup Update \u2014 {date_str}"
+
+# Comment footer disclaimer
+ADF_FOOTER_TEXT = "Generated by Standup Agent based on meeting notes; verify accuracy before relying on this content. For discrepancies, contact your Product Owner."
+
 # Spoken digit mapping
 SPOKEN_DIGITS = {
     'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
     'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9'
 }
 
+# Transcript patterns, compiled once at import
+_SPOKEN_WORDS = '|'.join(SPOKEN_DIGITS.keys())
+_FULL_KEY_RE = re.compile(r'\b([A-Z]{2,10}-\d+)\b')
+_PARTIAL_RE = re.compile(r'(?:ticket|issue|bug|story)\s+(\d+)', re.IGNORECASE)
+_SPOKEN_RE = re.compile(r'\b(' + _SPOKEN_WORDS + r')(?:\s+(' + _SPOKEN_WORDS + r'))*', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'\d+')
+_SPEAKER_NAME_MAX = 40
+_SPEAKER_RE = re.compile(r'^([A-Z][a-zA-Z\s]{1,%d}):\s*(.*)$' % _SPEAKER_NAME_MAX)
+_DATE_RES = [
+    # Patterns like "Standup for 27 Oct", "27 October 2025"
+    re.compile(r'(?:standup|meeting)\s+(?:for|on)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*(?:\s+\d{4})?)', re.IGNORECASE),
+    re.compile(r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})', re.IGNORECASE),
+]
+
+
+def run_in_thread(func):
+    """Expose a blocking tool to ADK as a coroutine
+    
+    ADK awaits async tools concurrently when the model issues several calls in
+    one turn (e.g. posting every ticket's comment), while sync tools block the
+    event loop one after another. The wrapped function runs on a worker thread.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
 
 def load_oauth_credentials():
     """Load OAuth client credentials from credentials.json"""
@@ -48,12 +121,38 @@ def load_oauth_credentials():
         return client_config['client_id'], client_config['client_secret']
 
 
+def load_jira_oauth_credentials():
+    """Load Jira OAuth client credentials and site from the environment (read once)"""
+    global _JIRA_OAUTH_CONFIG
+    if _JIRA_OAUTH_CONFIG is None:
+        missing = [name for name in ('ATLASSIAN_CLIENT_ID', 'ATLASSIAN_CLIENT_SECRET') if not os.environ.get(name)]
+        if missing:
+            raise ValueError(f"Missing Jira OAuth settings: {', '.join(missing)}")
+        
+        site_url = os.environ.get('ATLASSIAN_SITE_URL') or DEFAULT_JIRA_SITE_URL
+        site_url = site_url.split('://', 1)[-1].rstrip('/')
+        _JIRA_OAUTH_CONFIG = (os.environ['ATLASSIAN_CLIENT_ID'], os.environ['ATLASSIAN_CLIENT_SECRET'], site_url)
+    return _JIRA_OAUTH_CONFIG
+
+
+@lru_cache(maxsize=128)
+def parse_date(date_str):
+    """Parse a date string, trying the known strptime formats before dateutil"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            pass
+    
+    from dateutil import parser
+    return parser.parse(date_str)
+
+
 def get_sydney_date(date_str=None):
     """Get date in Australia/Sydney timezone"""
     if date_str:
         # Parse provided date
-        from dateutil import parser
-        dt = parser.parse(date_str)
+        dt = parse_date(date_str)
         return dt.astimezone(SYDNEY_TZ)
     return datetime.now(SYDNEY_TZ)
 
@@ -61,21 +160,24 @@ def get_sydney_date(date_str=None):
 def extract_ticket_keys(text, default_project="WJR"):
     """Extract Jira ticket keys from text with confidence levels"""
     tickets = []
+    seen = set()
     
     # Full key pattern (HIGH confidence)
-    full_pattern = r'\b([A-Z]{2,10}-\d+)\b'
-    for match in re.finditer(full_pattern, text):
-        tickets.append({
-            'key': match.group(1),
-            'confidence': 'high',
-            'type': 'full_key'
-        })
+    for match in _FULL_KEY_RE.finditer(text):
+        key = match.group(1)
+        if key not in seen:
+            seen.add(key)
+            tickets.append({
+                'key': key,
+                'confidence': 'high',
+                'type': 'full_key'
+            })
     
     # Partial numeric pattern (MEDIUM confidence)
-    partial_pattern = r'(?:ticket|issue|bug|story)\s+(\d+)'
-    for match in re.finditer(partial_pattern, text, re.IGNORECASE):
+    for match in _PARTIAL_RE.finditer(text):
         key = f"{default_project}-{match.group(1)}"
-        if not any(t['key'] == key for t in tickets):
+        if key not in seen:
+            seen.add(key)
             tickets.append({
                 'key': key,
                 'confidence': 'medium',
@@ -83,12 +185,12 @@ def extract_ticket_keys(text, default_project="WJR"):
             })
     
     # Spoken digits pattern (LOW confidence)
-    spoken_pattern = r'\b(' + '|'.join(SPOKEN_DIGITS.keys()) + r')(?:\s+(' + '|'.join(SPOKEN_DIGITS.keys()) + r'))*'
-    for match in re.finditer(spoken_pattern, text, re.IGNORECASE):
+    for match in _SPOKEN_RE.finditer(text):
         digits = ''.join(SPOKEN_DIGITS.get(word.lower(), '') for word in match.group(0).split())
         if len(digits) >= 3:
             key = f"{default_project}-{digits}"
-            if not any(t['key'] == key for t in tickets):
+            if key not in seen:
+                seen.add(key)
                 tickets.append({
                     'key': key,
                     'confidence': 'low',
@@ -101,92 +203,104 @@ def extract_ticket_keys(text, default_project="WJR"):
 def parse_speakers(text):
     """Parse speaker attributions from transcript"""
     speakers = {}
-    current_speaker = None
+    current_lines = None
+    colon_window = _SPEAKER_NAME_MAX + 2
     
-    lines = text.split('\n')
-    for line in lines:
-        # Detect speaker pattern: "Name:" or "Name -"
-        speaker_match = re.match(r'^([A-Z][a-zA-Z\s]+):\s*(.*)$', line.strip())
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        
+        # Detect speaker pattern "Name: ..." - only run the regex on lines that can match
+        speaker_match = None
+        if line[0].isupper() and ':' in line[:colon_window]:
+            speaker_match = _SPEAKER_RE.match(line)
+        
         if speaker_match:
-            current_speaker = speaker_match.group(1).strip()
+            current_lines = speakers.setdefault(speaker_match.group(1).strip(), [])
             content = speaker_match.group(2).strip()
-            if current_speaker not in speakers:
-                speakers[current_speaker] = []
             if content:
-                speakers[current_speaker].append(content)
-        elif current_speaker and line.strip():
-            speakers[current_speaker].append(line.strip())
+                current_lines.append(content)
+        elif current_lines is not None:
+            current_lines.append(line)
     
     return speakers
 
 
+def index_ticket_mentions(speakers):
+    """Index speaker lines by the ticket keys and bare numbers they mention
+    
+    Args:
+        speakers: Speaker name to lines mapping from parse_speakers
+    
+    Returns:
+        dict: Mentioned key or number to (speaker_index, line_index) positions
+    """
+    index = {}
+    for speaker_idx, lines in enumerate(speakers.values()):
+        for line_idx, line in enumerate(lines):
+            tokens = set(_FULL_KEY_RE.findall(line))
+            tokens.update(_NUMBER_RE.findall(line))
+            for token in tokens:
+                index.setdefault(token, []).append((speaker_idx, line_idx))
+    return index
+
+
 def extract_date_from_transcript(text):
     """Extract date mentioned in transcript"""
-    # Patterns like "Standup for 27 Oct", "27 October 2025"
-    date_patterns = [
-        r'(?:standup|meeting)\s+(?:for|on)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*(?:\s+\d{4})?)',
-        r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_RES:
+        match = pattern.search(text)
         if match:
-            from dateutil import parser
+            date_str = match.group(1)
+            if not date_str[-4:].isdigit():
+                # "27 Oct" - no year given, assume the current one
+                date_str = f"{date_str} {datetime.now(SYDNEY_TZ).year}"
             try:
-                return parser.parse(match.group(1))
+                return parse_date(date_str)
             except:
                 pass
     
     return None
 
 
-def generate_adf_comment(content, date_str, speakers_data):
-    """Generate Atlassian Document Format comment"""
-    adf = {
-        "version": 1,
-        "type": "doc",
+def _adf_heading(text):
+    """ADF level-3 heading node"""
+    return {"type": "heading", "attrs": {"level": 3}, "content": [{"type": "text", "text": text}]}
+
+
+def _adf_bullets(points):
+    """ADF bullet list node with one item per point"""
+    return {
+        "type": "bulletList",
         "content": [
-            {
-                "type": "paragraph",
-                "content": [{"type": "text", "text": f"Standup Update — {date_str}", "marks": [{"type": "strong"}]}]
-            }
+            {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": point}]}]}
+            for point in points
         ]
     }
-    
-    # Add speaker sections
-    for speaker, points in speakers_data.items():
-        adf["content"].append({
-            "type": "heading",
-            "attrs": {"level": 3},
-            "content": [{"type": "text", "text": speaker}]
-        })
-        
-        bullet_items = []
-        for point in points:
-            bullet_items.append({
-                "type": "listItem",
-                "content": [{
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": point}]
-                }]
-            })
-        
-        adf["content"].append({
-            "type": "bulletList",
-            "content": bullet_items
-        })
-    
-    # Add footer
-    adf["content"].append({
+
+
+def _adf_footer():
+    """ADF italic disclaimer paragraph"""
+    return {"type": "paragraph", "content": [{"type": "text", "text": ADF_FOOTER_TEXT, "marks": [{"type": "em"}]}]}
+
+
+def generate_adf_comment(content, date_str, speakers_data):
+    """Generate Atlassian Document Format comment"""
+    header = {
         "type": "paragraph",
-        "content": [{
-            "type": "text",
-            "text": "Generated by Standup Agent based on meeting notes; verify accuracy before relying on this content. For discrepancies, contact your Product Owner.",
-            "marks": [{"type": "em"}]
-        }]
-    })
+        "content": [{"type": "text", "text": STANDUP_TITLE.format(date_str=date_str), "marks": [{"type": "strong"}]}]
+    }
     
-    return adf
+    # Header, a heading + bullet list per speaker, then footer
+    return {
+        "version": 1,
+        "type": "doc",
+        "content": [header] + [
+            node
+            for speaker, points in speakers_data.items()
+            for node in (_adf_heading(speaker), _adf_bullets(points))
+        ] + [_adf_footer()]
+    }
 
 
 def get_meet_code(hangout_link):
@@ -202,42 +316,102 @@ def get_meet_code(hangout_link):
 def read_document_content(drive_service, file_id):
     """Download and return plain text content of a Google Doc"""
     try:
-        from googleapiclient.http import MediaIoBaseDownload
-        import io
-        
-        request = drive_service.files().export_media(fileId=file_id, mimeType='text/plain')
-        file_content = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_content, request)
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-        return file_content.getvalue().decode('utf-8')
+        # Exports are capped at 10 MB, so one request fetches the whole document
+        content = drive_service.files().export(fileId=file_id, mimeType='text/plain').execute()
+        return content.decode('utf-8')
     except Exception as e:
         return f"Error reading document: {e}"
 
 
+def _meeting_notes_request(drive_service, event_summary, event_time):
+    """Build the Drive search for the Gemini notes named after the event, created 0-4 hours after it"""
+    # Drive query strings escape backslashes and single quotes with a backslash
+    safe_summary = event_summary[:MEETING_NOTES_NAME_MAX].replace('\\', '\\\\').replace("'", "\\'")
+    window_end = event_time + timedelta(hours=4)
+    query = (
+        "mimeType='application/vnd.google-apps.document'"
+        " and (name contains 'Notes by Gemini' or name contains 'Meeting notes')"
+        f" and name contains '{safe_summary}'"
+        f" and createdTime >= '{event_time.isoformat()}' and createdTime <= '{window_end.isoformat()}'"
+    )
+    return drive_service.files().list(
+        q=query, spaces='drive',
+        fields=MEETING_NOTES_FIELDS,
+        orderBy='modifiedTime desc', pageSize=1
+    )
+
+
+def _notes_info(files):
+    """Shape the first matching Drive file into notes info"""
+    if not files:
+        return None
+    file = files[0]
+    return {'id': file['id'], 'name': file['name'], 'link': file['webViewLink']}
+
+
 def search_meeting_notes(drive_service, event_summary, event_time):
     """Search for Gemini meeting notes in Drive"""
     try:
-        query = "mimeType='application/vnd.google-apps.document' and (name contains 'Notes by Gemini' or name contains 'Meeting notes')"
-        results = drive_service.files().list(
-            q=query, spaces='drive',
-            fields='files(id, name, createdTime, modifiedTime, webViewLink)',
-            orderBy='modifiedTime desc', pageSize=50
-        ).execute()
-        
-        files = results.get('files', [])
-        for file in files:
-            if event_summary.lower() in file['name'].lower():
-                file_time = datetime.fromisoformat(file['createdTime'].replace('Z', '+00:00'))
-                time_diff = (file_time - event_time).total_seconds()
-                if 0 <= time_diff <= 14400:  # 0-4 hours after meeting
-                    return {'id': file['id'], 'name': file['name'], 'link': file['webViewLink']}
-        return None
+        results = _meeting_notes_request(drive_service, event_summary, event_time).execute(num_retries=DRIVE_NUM_RETRIES)
+        return _notes_info(results.get('files', []))
     except:
         return None
 
 
+def batch_search_meeting_notes(drive_service, events):
+    """Search Drive for the notes of several events using batched HTTP requests
+    
+    Searches that fail inside a batch (e.g. rate-limited) are retried one by one.
+    
+    Args:
+        events: List of (event_id, event_summary, event_time) tuples
+    
+    Returns:
+        dict: Notes info (or None) keyed by event_id
+    """
+    found = {}
+    failed = []
+    
+    def on_response(request_id, response, exception):
+        event = events[int(request_id)]
+        if exception is not None:
+            # e.g. a per-request rate limit - retry rather than report no notes
+            failed.append(event)
+        else:
+            found[event[0]] = _notes_info(response.get('files', []))
+    
+    for start in range(0, len(events), DRIVE_BATCH_LIMIT):
+        batch = drive_service.new_batch_http_request(callback=on_response)
+        for i in range(start, min(start + DRIVE_BATCH_LIMIT, len(events))):
+            _, event_summary, event_time = events[i]
+            batch.add(_meeting_notes_request(drive_service, event_summary, event_time), request_id=str(i))
+        batch.execute()
+    
+    if failed:
+        found.update(parallel_search_meeting_notes(drive_service, failed))
+    return found
+
+
+def parallel_search_meeting_notes(drive_service, events):
+    """Search Drive for the notes of several events concurrently, one request per event
+    
+    Args:
+        events: List of (event_id, event_summary, event_time) tuples
+    
+    Returns:
+        dict: Notes info (or None) keyed by event_id
+    """
+    found = {}
+    with ThreadPoolExecutor(max_workers=min(DRIVE_MAX_WORKERS, len(events))) as executor:
+        futures = {
+            executor.submit(search_meeting_notes, drive_service, event_summary, event_time): event_id
+            for event_id, event_summary, event_time in events
+        }
+        for future in as_completed(futures):
+            found[futures[future]] = future.result()
+    return found
+
+
 def check_for_transcript_and_recording(cal_service, drive_service, meet_code, event_summary, event_time):
     """Check if meeting has transcript, recording, or notes"""
     if not meet_code:
@@ -253,41 +427,179 @@ def check_for_transcript_and_recording(cal_service, drive_service, meet_code, ev
     return result if result['notes'] else None
 
 
+def hash_token(token):
+    """Hash a token for use as a cache key without keeping the token itself"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def single_flight_refresh(key, refresh):
+    """Run refresh() once per key, sharing its result with concurrent callers
+    
+    Refresh tokens may rotate on use, so parallel refreshes with the same token
+    can invalidate each other. Callers arriving while a refresh is in flight
+    wait on the same Future instead of starting their own.
+    """
+    with _REFRESH_LOCK:
+        future = _REFRESH_FUTURES.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _REFRESH_FUTURES[key] = Future()
+    
+    if is_owner:
+        try:
+            future.set_result(refresh())
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with _REFRESH_LOCK:
+                _REFRESH_FUTURES.pop(key, None)
+    
+    return future.result()
+
+
+def refresh_jira_token(refresh_token, token_uri, client_id, client_secret):
+    """Exchange a Jira refresh token for a new access token"""
+    response = get_jira_session().post(token_uri, data=orjson.dumps({
+        "grant_type": "refresh_token",
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "refresh_token": refresh_token,
+    }), headers={"Content-Type": "application/json"}, timeout=10)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    # Atlassian rotates refresh tokens, so the new one must replace the old
+    return {
+        "access_token": data["access_token"],
+        "refresh_token": data.get("refresh_token", refresh_token),
+        "expires_at": time.time() + data.get("expires_in", 3600),
+    }
+
+
+def _refresh_google_token(creds):
+    """Refresh Google credentials and return the updated token info"""
+    from google.auth.transport.requests import Request
+    
+    creds.refresh(Request())
+    return orjson.loads(creds.to_json())
+
+
+def get_jira_session():
+    """Get the shared pooled requests session for Jira API calls"""
+    global _JIRA_SESSION
+    with _JIRA_SESSION_LOCK:
+        if _JIRA_SESSION is None:
+            import requests
+            from http.cookiejar import DefaultCookiePolicy
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # Retry transient failures on idempotent requests; POSTs (comments) are never retried
+            retries = Retry(
+                total=JIRA_RETRY_TOTAL, backoff_factor=JIRA_RETRY_BACKOFF_SEC,
+                status_forcelist=JIRA_RETRY_STATUSES, raise_on_status=False
+            )
+            session = requests.Session()
+            # The session is shared by every user, so never store or replay cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount(JIRA_API_BASE, HTTPAdapter(pool_connections=4, pool_maxsize=JIRA_POOL_SIZE, max_retries=retries))
+            _JIRA_SESSION = session
+        return _JIRA_SESSION
+
+
+def post_read_only_jira(session, url, **kwargs):
+    """POST to a read-only Jira endpoint, retrying transient failures like a GET
+    
+    The session's adapter never retries POSTs so comments cannot be duplicated;
+    endpoints that only read (e.g. issue/bulkfetch) retry here instead.
+    """
+    import requests
+    
+    for attempt in range(JIRA_RETRY_TOTAL + 1):
+        if attempt:
+            time.sleep(JIRA_RETRY_BACKOFF_SEC * 2 ** (attempt - 1))
+        try:
+            response = session.post(url, **kwargs)
+        except requests.ConnectionError:
+            if attempt == JIRA_RETRY_TOTAL:
+                raise
+            continue
+        if response.status_code not in JIRA_RETRY_STATUSES:
+            break
+    return response
+
+
 def get_jira_cloud_id(access_token, tool_context):
     """Get Jira cloud ID and cache it"""
-    import requests
+    # Check process-wide cache first, then session state
+    token_key = hash_token(access_token)[:16]
+    with _CLOUD_ID_LOCK:
+        cached = _CLOUD_ID_CACHE.get(token_key)
+    if cached and time.time() - cached[1] < JIRA_CLOUD_ID_TTL_SEC:
+        return cached[0]
     
-    # Check cache first
     cached_cloud_id = tool_context.state.get(JIRA_TOKEN_CACHE_KEY + "_cloud_id")
     if cached_cloud_id:
         return cached_cloud_id
     
     # Fetch cloud ID
-    resources_url = "https://api.atlassian.com/oauth/token/accessible-resources"
+    resources_url = f"{JIRA_API_BASE}/oauth/token/accessible-resources"
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Accept": "application/json"
     }
     
-    response = requests.get(resources_url, headers=headers, timeout=10)
+    response = get_jira_session().get(resources_url, headers=headers, timeout=10)
     if response.status_code != 200:
         return None
     
-    resources = response.json()
+    resources = orjson.loads(response.content)
     if not resources:
         return None
     
     cloud_id = resources[0]['id']
     
-    # Cache it
+    # Cache it, dropping entries for expired tokens so the cache stays bounded
+    now = time.time()
+    with _CLOUD_ID_LOCK:
+        for key in [key for key, (_, ts) in _CLOUD_ID_CACHE.items() if now - ts >= JIRA_CLOUD_ID_TTL_SEC]:
+            del _CLOUD_ID_CACHE[key]
+        _CLOUD_ID_CACHE[token_key] = (cloud_id, now)
     tool_context.state[JIRA_TOKEN_CACHE_KEY + "_cloud_id"] = cloud_id
     
     return cloud_id
 
 
+@lru_cache(maxsize=None)
+def _discovery_document(service_name, version):
+    """Load the discovery document bundled with googleapiclient, once per API"""
+    from googleapiclient.discovery_cache import get_static_doc
+    
+    return get_static_doc(service_name, version)
+
+
+def _build_google_service(service_name, version, creds):
+    """Build a Google API client that is safe to share across threads"""
+    from googleapiclient.discovery import build, build_from_document
+    from googleapiclient.http import HttpRequest
+    import google_auth_httplib2
+    import httplib2
+    
+    def build_request(http, *args, **kwargs):
+        # httplib2.Http is not thread-safe, so every request gets its own transport
+        return HttpRequest(google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http()), *args, **kwargs)
+    
+    http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+    document = _discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, http=http, requestBuilder=build_request, cache_discovery=False)
+    return build_from_document(document, http=http, requestBuilder=build_request)
+
+
 def get_authenticated_google_services(tool_context, auth_scheme, auth_credential, client_id, client_secret):
     """Get authenticated Google API services"""
     from google.adk.auth import AuthConfig
+    from google.oauth2.credentials import Credentials
     
     creds = None
     cached_token_info = tool_context.state.get(TOKEN_CACHE_KEY + "_google")
@@ -296,8 +608,10 @@ def get_authenticated_google_services(tool_context, auth_scheme, auth_credential
         try:
             creds = Credentials.from_authorized_user_info(cached_token_info, list(GOOGLE_SCOPES.keys()))
             if not creds.valid and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                tool_context.state[TOKEN_CACHE_KEY + "_google"] = json.loads(creds.to_json())
+                refresh_key = "google_" + hash_token(creds.refresh_token)
+                token_info = single_flight_refresh(refresh_key, lambda: _refresh_google_token(creds))
+                creds = Credentials.from_authorized_user_info(token_info, list(GOOGLE_SCOPES.keys()))
+                tool_context.state[TOKEN_CACHE_KEY + "_google"] = token_info
             elif not creds.valid:
                 creds = None
         except:
@@ -317,7 +631,7 @@ def get_authenticated_google_services(tool_context, auth_scheme, auth_credential
                 client_secret=client_secret,
                 scopes=list(GOOGLE_SCOPES.keys()),
             )
-            tool_context.state[TOKEN_CACHE_KEY + "_google"] = json.loads(creds.to_json())
+            tool_context.state[TOKEN_CACHE_KEY + "_google"] = orjson.loads(creds.to_json())
     
     if not creds or not creds.valid:
         tool_context.request_credential(
@@ -325,6 +639,6 @@ def get_authenticated_google_services(tool_context, auth_scheme, auth_credential
         )
         return None
     
-    calendar_service = build('calendar', 'v3', credentials=creds)
-    drive_service = build('drive', 'v3', credentials=creds)
+    calendar_service = _build_google_service('calendar', 'v3', creds)
+    drive_service = _build_google_service('drive', 'v3', creds)
     return calendar_service, drive_service
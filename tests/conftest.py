@@ -0,0 +1,17 @@
+import json
+import os
+import sys
+import tempfile
+
+# Make the Standup_agent package importable from a plain `pytest` run
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing the package runs config, which loads OAuth client credentials
+_CREDENTIALS_DIR = tempfile.mkdtemp()
+_CREDENTIALS_PATH = os.path.join(_CREDENTIALS_DIR, 'credentials.json')
+with open(_CREDENTIALS_PATH, 'w') as f:
+    json.dump({"installed": {"client_id": "test-client-id", "client_secret": "test-client-secret"}}, f)
+
+os.environ.setdefault('STANDUP_CREDENTIALS_PATH', _CREDENTIALS_PATH)
+os.environ.setdefault('ATLASSIAN_CLIENT_ID', 'test-jira-client-id')
+os.environ.setdefault('ATLASSIAN_CLIENT_SECRET', 'test-jira-client-secret')
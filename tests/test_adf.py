@@ -0,0 +1,11 @@
+import orjson
+
+from Standup_agent.utils import generate_adf_comment
+
+
+def test_title_em_dash_round_trips_through_orjson():
+    body = orjson.dumps(generate_adf_comment({}, "1 Jan", {}))
+    assert "—".encode() in body
+    
+    adf = orjson.loads(body)
+    assert adf["content"][0]["content"][0]["text"] == "Standup Update — 1 Jan"